@@ -1,3 +1,11 @@
+from io import BytesIO
+import threading
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
 import pandas as pd
 
 __version__ = '0.2.2'
@@ -71,6 +79,126 @@ def read_sj_out_tab(filename):
     return sj
 
 
+def _read_bytes(filename, opener):
+    """Read the raw contents of a file, using opener(filename, 'rb')"""
+    f = opener(filename, 'rb')
+    try:
+        return f.read()
+    finally:
+        f.close()
+
+
+def _prefetch_worker(tasks, results, opener):
+    """Read raw file contents for each (index, filename) task until a None
+    sentinel is received, putting either the bytes or the raised exception
+    into the index's result queue"""
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        i, filename = task
+        try:
+            result = (True, _read_bytes(filename, opener))
+        except BaseException as e:
+            result = (False, e)
+        results[i].put(result)
+        del result
+
+
+def iter_sj_out_tabs(filenames, n_threads=4, max_prefetch=8, opener=open):
+    """Iterate over many SJ.out.tab files, prefetching them in the background
+
+    The raw bytes of upcoming files are read by a pool of threads, while the
+    calling thread parses the files that have already been read. This hides
+    I/O latency on slow filesystems, such as network (NFS) mounts.
+
+    Parameters
+    ----------
+    filenames : list-like of str
+        Filenames of the SJ.out.tab files you want to read in
+    n_threads : int, optional
+        Number of threads reading files concurrently. Default 4
+    max_prefetch : int, optional
+        Maximum number of files which are being read or have been read but
+        not yet parsed, so at most this many raw files are held in memory at
+        once. The next file is only read after the current one is parsed.
+        Default 8
+    opener : callable, optional
+        Function called as opener(filename, 'rb') to get a file handle.
+        Default: the builtin open
+
+    Yields
+    ------
+    filename : str
+        Filename of the SJ.out.tab file, in the same order as `filenames`
+    sj : pandas.DataFrame
+        Dataframe of splice junctions of that file, as created by
+        read_sj_out_tab
+
+    Raises
+    ------
+    ValueError
+        If `n_threads` or `max_prefetch` is less than 1
+
+    Note
+    ----
+    If reading a file raises an exception, it is re-raised when that file is
+    reached in the iteration.
+    """
+    if n_threads < 1:
+        raise ValueError('n_threads must be at least 1, not '
+                         '{0}'.format(n_threads))
+    if max_prefetch < 1:
+        raise ValueError('max_prefetch must be at least 1, not '
+                         '{0}'.format(max_prefetch))
+    return _iter_sj_out_tabs(list(filenames), n_threads, max_prefetch, opener)
+
+
+def _iter_sj_out_tabs(filenames, n_threads, max_prefetch, opener):
+    """Generator doing the work of iter_sj_out_tabs, after its arguments have
+    been validated"""
+    tasks = queue.Queue()
+    results = [queue.Queue(maxsize=1) for _ in filenames]
+    n_threads = min(n_threads, max_prefetch, len(filenames))
+
+    threads = []
+    for _ in range(n_threads):
+        thread = threading.Thread(target=_prefetch_worker,
+                                  args=(tasks, results, opener))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    # Only hand out a new file once an old one has been consumed, so that
+    # slow parsing applies back-pressure to the readers
+    n_submitted = min(max_prefetch, len(filenames))
+    for i in range(n_submitted):
+        tasks.put((i, filenames[i]))
+
+    try:
+        for i, filename in enumerate(filenames):
+            success, contents = results[i].get()
+            results[i] = None
+            if not success:
+                raise contents
+            sj = read_sj_out_tab(BytesIO(contents))
+            del contents
+            if n_submitted < len(filenames):
+                tasks.put((n_submitted, filenames[n_submitted]))
+                n_submitted += 1
+            yield filename, sj
+    finally:
+        # Cancel reads which have not started yet, e.g. if the caller stopped
+        # iterating early or a read failed
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in threads:
+            tasks.put(None)
+
+
 def chr_start_stop_to_sj_ind(chr_start_stop, sj):
     """Transform a 'chr1:100-200' string into index range of sj dataframe
 
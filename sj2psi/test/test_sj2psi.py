@@ -1,3 +1,7 @@
+from io import BytesIO
+import threading
+import time
+
 import pandas as pd
 import pandas.util.testing as pdt
 import pytest
@@ -7,6 +11,11 @@ try:
 except ImportError:
     from io import StringIO
 
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
 
 @pytest.fixture
 def example_sj_out_tab(tmpdir):
@@ -127,3 +136,144 @@ def test_chr_start_stop_to_sj_ind(chr_start_stop, sj):
     true_output = (sj.chrom == chrom) & (start < sj.intron_start) \
         & (sj.intron_stop < stop)
     pdt.assert_array_equal(test_output, true_output)
+
+
+class SlowOpener(object):
+    """Open files after a per-file delay, keeping track of which files were
+    opened and how many were open at once"""
+
+    def __init__(self, delays=None):
+        self.delays = {} if delays is None else delays
+        self.opened = []
+        self.n_open = 0
+        self.max_open = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, filename, mode='rb'):
+        with self.lock:
+            self.opened.append(filename)
+            self.n_open += 1
+            self.max_open = max(self.max_open, self.n_open)
+        try:
+            time.sleep(self.delays.get(filename, 0))
+            with open(filename, mode) as f:
+                return BytesIO(f.read())
+        finally:
+            with self.lock:
+                self.n_open -= 1
+
+
+def _join_new_threads(threads_before):
+    """Wait for all threads which were started after threads_before"""
+    for thread in threading.enumerate():
+        if thread not in threads_before:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+
+@pytest.fixture
+def sj_out_tabs(example_sj_out_tab, tmpdir):
+    """Several SJ.out.tab files, each with a different number of junctions"""
+    with open(example_sj_out_tab) as f:
+        lines = f.readlines()
+    filenames = []
+    for i in range(6):
+        filename = '{0}/sample{1}.SJ.out.tab'.format(tmpdir, i)
+        with open(filename, 'w') as f:
+            f.writelines(lines[:i + 2])
+        filenames.append(filename)
+    return filenames
+
+
+@pytest.fixture(params=[1, 3])
+def n_threads(request):
+    return request.param
+
+
+def test_iter_sj_out_tabs(sj_out_tabs, n_threads):
+    from sj2psi import iter_sj_out_tabs, read_sj_out_tab
+
+    # Later files are read faster, so they finish reading first
+    delays = dict((filename, 0.05 * (len(sj_out_tabs) - i))
+                  for i, filename in enumerate(sj_out_tabs))
+    opener = SlowOpener(delays)
+    test_output = list(iter_sj_out_tabs(sj_out_tabs, n_threads=n_threads,
+                                        max_prefetch=4, opener=opener))
+
+    assert [filename for filename, sj in test_output] == sj_out_tabs
+    for filename, sj in test_output:
+        pdt.assert_frame_equal(sj, read_sj_out_tab(filename))
+    assert opener.max_open <= n_threads
+    if n_threads > 1:
+        assert opener.max_open > 1
+
+
+def test_iter_sj_out_tabs_back_pressure(example_sj_out_tab):
+    from sj2psi import iter_sj_out_tabs
+
+    max_prefetch = 2
+    filenames = [example_sj_out_tab] * 10
+    opened = queue.Queue()
+
+    def opener(filename, mode='rb'):
+        opened.put(filename)
+        return open(filename, mode)
+
+    threads_before = threading.enumerate()
+    sjs = iter_sj_out_tabs(filenames, n_threads=max_prefetch + 2,
+                           max_prefetch=max_prefetch, opener=opener)
+    next(sjs)
+
+    # The first file was consumed, so exactly max_prefetch more are read,
+    # even though there are idle threads
+    for _ in range(1 + max_prefetch):
+        opened.get(timeout=5)
+    sjs.close()
+    _join_new_threads(threads_before)
+    assert opened.empty()
+
+
+def test_iter_sj_out_tabs_close_cancels_reads(example_sj_out_tab):
+    from sj2psi import iter_sj_out_tabs
+
+    filenames = [example_sj_out_tab] * 10
+    opened = []
+    gate = threading.Event()
+
+    def opener(filename, mode='rb'):
+        opened.append(filename)
+        # Let the first file through, then block until the gate is opened
+        if len(opened) > 1:
+            gate.wait()
+        return open(filename, mode)
+
+    threads_before = threading.enumerate()
+    sjs = iter_sj_out_tabs(filenames, n_threads=1, max_prefetch=8,
+                           opener=opener)
+    next(sjs)
+    sjs.close()
+    gate.set()
+    _join_new_threads(threads_before)
+
+    # Only the consumed file and the one being read when closed are opened
+    assert len(opened) <= 2
+
+
+@pytest.mark.parametrize('kwargs', [{'n_threads': 0}, {'max_prefetch': 0}])
+def test_iter_sj_out_tabs_invalid_arguments(example_sj_out_tab, kwargs):
+    from sj2psi import iter_sj_out_tabs
+
+    with pytest.raises(ValueError):
+        iter_sj_out_tabs([example_sj_out_tab], **kwargs)
+
+
+def test_iter_sj_out_tabs_missing_file(example_sj_out_tab, tmpdir):
+    from sj2psi import iter_sj_out_tabs
+
+    filenames = [example_sj_out_tab,
+                 '{0}/does_not_exist.SJ.out.tab'.format(tmpdir)]
+    sjs = iter_sj_out_tabs(filenames)
+    filename, sj = next(sjs)
+    assert filename == example_sj_out_tab
+    with pytest.raises(IOError):
+        next(sjs)